@@ -6,14 +6,19 @@ Represents an input or output connector on a node.
 Connectors allow data to flow between nodes.
 """
 
+import sys
 from enum import Enum
 from pydantic import BaseModel, Field, PrivateAttr
-from typing import Optional, Any, List, TYPE_CHECKING
+from typing import Optional, Any, Dict, List, TYPE_CHECKING
 
 from ..signals import Signal
 
 if TYPE_CHECKING:
     from .node_model import NodeModel
+    from .network_model import NetworkModel
+
+# Data type compatible with every other type
+_ANY_DATA_TYPE = sys.intern("any")
 
 
 class ConnectorType(Enum):
@@ -48,7 +53,8 @@ class ConnectorModel(BaseModel):
     description: str = ""
 
     # Private attributes
-    _connections: List["ConnectorModel"] = PrivateAttr(default_factory=list)
+    # Connected connectors keyed by id(), models are not hashable
+    _connections: Dict[int, "ConnectorModel"] = PrivateAttr(default_factory=dict)
     _cached_value: Any = PrivateAttr(default=None)
     _is_dirty: bool = PrivateAttr(default=True)
     _connected_changed: Signal = PrivateAttr(default=None)
@@ -62,6 +68,9 @@ class ConnectorModel(BaseModel):
         if self.label is None:
             self.label = self.name
 
+        # Interned so type checks in _can_connect_to are identity comparisons
+        self.data_type = sys.intern(self.data_type)
+
         self._connected_changed = Signal()
 
     @property
@@ -98,11 +107,17 @@ class ConnectorModel(BaseModel):
             other.disconnect_all()
 
         # Add connection
-        if other not in self._connections:
-            self._connections.append(other)
+        if id(other) not in self._connections:
+            self._connections[id(other)] = other
             # Also add reverse connection
-            if self not in other._connections:
-                other._connections.append(self)
+            other._connections[id(self)] = self
+
+            network = self._shared_network(other)
+            if network is not None:
+                if self.is_output():
+                    network._connector_connected(self, other)
+                else:
+                    network._connector_connected(other, self)
 
             self.mark_dirty()
 
@@ -123,12 +138,16 @@ class ConnectorModel(BaseModel):
         Returns:
             True if disconnection was successful
         """
-        if other in self._connections:
-            self._connections.remove(other)
-
+        if self._connections.pop(id(other), None) is not None:
             # Also remove reverse connection
-            if self in other._connections:
-                other._connections.remove(self)
+            other._connections.pop(id(self), None)
+
+            network = self._shared_network(other)
+            if network is not None:
+                if self.is_output():
+                    network._connector_disconnected(self, other)
+                else:
+                    network._connector_disconnected(other, self)
 
             self.mark_dirty()
 
@@ -141,7 +160,7 @@ class ConnectorModel(BaseModel):
 
     def disconnect_all(self) -> None:
         """Disconnect all connections."""
-        for conn in self._connections[:]:
+        for conn in list(self._connections.values()):
             self.disconnect_from(conn)
 
     def is_connected(self) -> bool:
@@ -150,7 +169,24 @@ class ConnectorModel(BaseModel):
 
     def connections(self) -> List["ConnectorModel"]:
         """Get list of connected connectors."""
-        return self._connections.copy()
+        return list(self._connections.values())
+
+    def _shared_network(self, other: "ConnectorModel") -> Optional["NetworkModel"]:
+        """
+        Get the network both connectors' nodes belong to.
+
+        Args:
+            other: The other connector
+
+        Returns:
+            The shared network, or None if the nodes are not in the same network
+        """
+        if self.node is None or other.node is None:
+            return None
+        network = self.node.network
+        if network is None or other.node.network is not network:
+            return None
+        return network
 
     def _can_connect_to(self, other: "ConnectorModel") -> bool:
         """
@@ -162,24 +198,23 @@ class ConnectorModel(BaseModel):
         Returns:
             True if connection is valid
         """
-        # Can't connect to self
-        if other is self:
-            return False
-
-        # Can't connect to same node
-        if other.node is self.node:
-            return False
-
-        # Input can only connect to output and vice versa
-        if self.connector_type == other.connector_type:
-            return False
-
-        # "any" type is compatible with everything,
-        # will be used when a node is created(no connections yet), and Python Script Node.
-        if self.data_type == "any" or other.data_type == "any":
-            return True
-
-        return self.data_type == other.data_type
+        # Cheapest and most discriminating checks first:
+        # - Input can only connect to output and vice versa (this also rejects self)
+        # - Types must match, "any" type is compatible with everything,
+        #   will be used when a node is created(no connections yet), and Python Script Node.
+        #   Identity is the fast path for interned types, data_type may be reassigned
+        #   later without interning, so fall back to equality.
+        # - Can't connect to same node
+        return (
+            self.connector_type is not other.connector_type
+            and (
+                self.data_type is other.data_type
+                or self.data_type == other.data_type
+                or self.data_type == _ANY_DATA_TYPE
+                or other.data_type == _ANY_DATA_TYPE
+            )
+            and other.node is not self.node
+        )
 
     def mark_dirty(self) -> None:
         """Mark this connector (and downstream) as dirty."""
@@ -188,9 +223,9 @@ class ConnectorModel(BaseModel):
 
         # Propagate dirty state downstream
         if self.is_output():
-            for conn in self._connections:
+            for conn in self._connections.values():
                 if conn.node:
-                    conn.node.mark_dirty()
+                    conn.node._mark_dirty()
 
     def get_value(self) -> Any:
         """
@@ -210,7 +245,7 @@ class ConnectorModel(BaseModel):
         else:
             # Input value: return connected value or default
             if self.is_connected():
-                source = self._connections[0]
+                source = next(iter(self._connections.values()))
                 return source.get_value()
             else:
                 return self.default_value
@@ -237,8 +272,9 @@ class ConnectorModel(BaseModel):
         Returns:
             ConnectorModel instance
         """
+        # Convert on a copy, the input dict may be shared with the caller
         if "connector_type" in data and isinstance(data["connector_type"], str):
-            data["connector_type"] = ConnectorType(data["connector_type"])
+            data = {**data, "connector_type": ConnectorType(data["connector_type"])}
 
         connector = cls.model_validate(data)
         connector.node = node
@@ -6,14 +6,26 @@ Represents a node network (graph).
 A network contains nodes and connections between them.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Iterator, ValuesView
 from uuid import UUID
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, count
+import logging
 import re
 
 from .connector_model import ConnectorModel
 from .node_model import NodeModel
 from ..signals import Signal
 
+logger = logging.getLogger(__name__)
+
+# Matches names with a numeric suffix, e.g. "Add_3" -> ("Add", "3")
+_NAME_SUFFIX_RE = re.compile(r'^(.+?)_(\d+)$')
+
+# Topology versions are shared by all networks, so a version is never reused
+_topology_versions = count()
+
 
 class NetworkModel:
     """
@@ -34,8 +46,27 @@ class NetworkModel:
 
     def __init__(self, name: str = "Network"):
         self.name = name
-        self._nodes: Dict[UUID, NodeModel] = {}
-        self._connector_pairs: List[Tuple[ConnectorModel, ConnectorModel]] = []
+        self._nodes: Dict[int, NodeModel] = {}
+        self._nodes_by_name: Dict[str, NodeModel] = {}
+        self._nodes_by_uuid: Dict[UUID, NodeModel] = {}
+        self._name_counters: Dict[str, int] = {}
+
+        # Incremental topological index (Pearce-Kelly), parents before children
+        self._topo_index: Dict[int, int] = {}
+        self._next_topo_index = 0
+        # Set when the index no longer matches the edges, see _connector_connected()
+        self._topo_index_stale = False
+        # Connections keyed by (id(output), id(input)) for O(1) removal
+        self._connector_pairs: Dict[Tuple[int, int], Tuple[ConnectorModel, ConnectorModel]] = {}
+
+        # Adjacency maintained incrementally: node id -> {neighbour id: connection count}
+        self._parents: Dict[int, Dict[int, int]] = {}
+        self._children: Dict[int, Dict[int, int]] = {}
+
+        # Cached topological order, recomputed only after topology changes
+        self._topo_cache: Optional[List[NodeModel]] = None
+        self._topo_dirty = True
+        self._topology_version = next(_topology_versions)
 
         # Signals
         self.node_added = Signal()
@@ -44,6 +75,32 @@ class NetworkModel:
         self.connection_removed = Signal()
         self.network_changed = Signal()
 
+        # Set while inside batch(), per-change signals are suppressed
+        self._signals_blocked = False
+
+    @contextmanager
+    def batch(self) -> Iterator["NetworkModel"]:
+        """
+        Group several changes into a single notification.
+
+        Inside the block no per-change signals (node_added, connection_added, ...)
+        are emitted. network_changed is emitted once when the outermost block exits.
+
+        Example::
+
+            with network.batch():
+                for node in nodes:
+                    network.add_node(node)
+        """
+        was_blocked = self._signals_blocked
+        self._signals_blocked = True
+        try:
+            yield self
+        finally:
+            self._signals_blocked = was_blocked
+            if not was_blocked:
+                self.network_changed.emit()
+
     # Node management
 
     def add_node(self, node: NodeModel) -> bool:
@@ -54,18 +111,37 @@ class NetworkModel:
             node: The node to add
 
         Returns:
-            True if node was added successfully
+            True if node was added successfully, False if a node with the same
+            id or uuid is already in the network
         """
-        if node.id in self._nodes:
+        if node.id in self._nodes or node.uuid in self._nodes_by_uuid:
             return False
 
         node.name = self._get_unique_node_name(node.name)
 
         node.network = self
         self._nodes[node.id] = node
-
-        self.node_added.emit(node)
-        self.network_changed.emit()
+        self._nodes_by_name[node.name] = node
+        self._nodes_by_uuid[node.uuid] = node
+        self._parents[node.id] = {}
+        self._children[node.id] = {}
+        self._topo_index[node.id] = self._next_topo_index
+        self._next_topo_index += 1
+        self._topology_changed()
+
+        # Connections made on the connectors before the node joined the network
+        for input_conn in node._inputs_view.values():
+            for source in input_conn.connections():
+                if source.node is not None and self._nodes.get(source.node.id) is source.node:
+                    self._connector_connected(source, input_conn)
+        for output_conn in node._outputs_view.values():
+            for target in output_conn.connections():
+                if target.node is not None and self._nodes.get(target.node.id) is target.node:
+                    self._connector_connected(output_conn, target)
+
+        if not self._signals_blocked:
+            self.node_added.emit(node)
+            self.network_changed.emit()
 
         return True
 
@@ -73,28 +149,76 @@ class NetworkModel:
         """
         Generate a unique node name by adding suffix if needed.
 
+        Suffixes come from a counter per base name that only moves forward, so
+        names of removed nodes are not handed out again.
+
         Args:
             base_name: The desired name for the node
 
         Returns:
             A unique name (original or with suffix like _1, _2, etc.)
         """
-        existing_names = {node.name for node in self._nodes.values()}
-
-        if base_name not in existing_names:
+        if base_name not in self._nodes_by_name:
             return base_name
 
-        match = re.match(r'^(.+?)_(\d+)$', base_name)
+        match = _NAME_SUFFIX_RE.match(base_name)
         if match:
             base_name = match.group(1)
 
-        counter = 1
-        while f"{base_name}_{counter}" in existing_names:
+        # Only skips names that were set explicitly (e.g. loaded from a file),
+        # so this is O(1) amortized
+        counter = self._name_counters.get(base_name, 0) + 1
+        while f"{base_name}_{counter}" in self._nodes_by_name:
             counter += 1
+        self._name_counters[base_name] = counter
 
         return f"{base_name}_{counter}"
 
-    def remove_node(self, node_id: UUID) -> bool:
+    def rename_node(self, node_id: int, new_name: str) -> Optional[str]:
+        """
+        Rename a node, adding a suffix if the name is already taken.
+
+        Assigning ``node.name`` directly does the same.
+
+        Args:
+            node_id: ID of the node to rename
+            new_name: The desired name
+
+        Returns:
+            The name given to the node, or None if the node is not in this network
+        """
+        node = self._nodes.get(node_id)
+        if node is None:
+            return None
+
+        node.name = new_name
+        return node.name
+
+    def _node_renamed(self, node: NodeModel, new_name: str) -> str:
+        """
+        Update the name index for a node that is being renamed.
+
+        Called by NodeModel when its name is assigned.
+
+        Args:
+            node: The node being renamed
+            new_name: The desired name
+
+        Returns:
+            The unique name to give the node
+        """
+        # Not added yet (e.g. while deserializing), add_node() picks the name
+        if self._nodes.get(node.id) is not node:
+            return new_name
+
+        if self._nodes_by_name.get(node.name) is node:
+            del self._nodes_by_name[node.name]
+
+        new_name = self._get_unique_node_name(new_name)
+        self._nodes_by_name[new_name] = node
+        return new_name
+
+    def remove_node(self, node_id: int) -> bool:
         """
         Remove a node from the network.
 
@@ -108,35 +232,39 @@ class NetworkModel:
         if not node:
             return False
 
-        # Remove connections from _connector_pairs that involve this node
-        self._connector_pairs = [
-            (src, tgt) for src, tgt in self._connector_pairs
-            if src.node is not node and tgt.node is not node
-        ]
-
-        # Disconnect all connectors first
-        for connector in list(node.inputs().values()) + list(node.outputs().values()):
+        # Disconnect all connectors first, the connectors report each removed
+        # connection back through _connector_disconnected()
+        for connector in chain(node._inputs_view.values(), node._outputs_view.values()):
             connector.disconnect_all()
 
         # Remove node
         del self._nodes[node_id]
+        if self._nodes_by_name.get(node.name) is node:
+            del self._nodes_by_name[node.name]
+        del self._nodes_by_uuid[node.uuid]
+        del self._topo_index[node_id]
+        del self._parents[node_id]
+        del self._children[node_id]
         node.network = None
+        self._topology_changed()
 
-        self.node_removed.emit(node)
-        self.network_changed.emit()
+        if not self._signals_blocked:
+            self.node_removed.emit(node)
+            self.network_changed.emit()
 
         return True
 
-    def get_node(self, node_id: UUID) -> Optional[NodeModel]:
+    def get_node(self, node_id: int) -> Optional[NodeModel]:
         """Get node by ID."""
         return self._nodes.get(node_id)
 
+    def get_node_by_uuid(self, node_uuid: UUID) -> Optional[NodeModel]:
+        """Get node by its persistent UUID (as stored in serialized data)."""
+        return self._nodes_by_uuid.get(node_uuid)
+
     def get_node_by_name(self, name: str) -> Optional[NodeModel]:
-        """Get node by name (returns first match)."""
-        for node in self._nodes.values():
-            if node.name == name:
-                return node
-        return None
+        """Get node by name."""
+        return self._nodes_by_name.get(name)
 
     def nodes(self) -> List[NodeModel]:
         """Get all nodes in the network."""
@@ -146,13 +274,27 @@ class NetworkModel:
         """Get the number of nodes in the network."""
         return len(self._nodes)
 
+    def topology_version(self) -> int:
+        """
+        Get the topology version.
+
+        The version changes whenever nodes are added/removed or connections
+        change, so it can be used as a key for caches derived from the topology.
+        """
+        return self._topology_version
+
+    def _topology_changed(self) -> None:
+        """Invalidate caches derived from the network topology."""
+        self._topo_dirty = True
+        self._topology_version = next(_topology_versions)
+
     # Connection management
 
     def connect(
         self,
-        source_node_id: UUID,
+        source_node_id: int,
         source_output: str,
-        target_node_id: UUID,
+        target_node_id: int,
         target_input: str
     ) -> bool:
         """
@@ -179,28 +321,175 @@ class NetworkModel:
         if not source_connector or not target_connector:
             return False
 
-        success = source_connector.connect_to(target_connector)
+        # Check if this connection creates a cycle before touching the connectors
+        if source_node is not target_node and self._creates_cycle(source_node, target_node):
+            logger.warning(
+                "Connection from %s.%s to %s.%s would create a cycle",
+                source_node.name, source_output, target_node.name, target_input,
+            )
+            return False
 
-        if success:
-            # Check if this connection creates a cycle
-            if self.has_cycle():
-                # Undo the connection
-                source_connector.disconnect_from(target_connector)
-                print(f"Warning: Connection from {source_node.name}.{source_output} to {target_node.name}.{target_input} would create a cycle")
-                return False
+        success = self._add_connection(source_connector, target_connector)
 
-            self._connector_pairs.append((source_connector, target_connector))
+        if success and not self._signals_blocked:
+            self.network_changed.emit()
 
+        return success
+
+    def _add_connection(self, source_connector: ConnectorModel, target_connector: ConnectorModel) -> bool:
+        """
+        Connect two connectors and record the connection, without any cycle check.
+
+        Args:
+            source_connector: The output connector
+            target_connector: The input connector
+
+        Returns:
+            True if connection was successful
+        """
+        # The connectors report the new (and any replaced) connection back through
+        # _connector_connected()/_connector_disconnected()
+        success = source_connector.connect_to(target_connector)
+
+        if success and not self._signals_blocked:
             self.connection_added.emit(source_connector, target_connector)
-            self.network_changed.emit()
 
         return success
 
+    def _creates_cycle(self, source_node: NodeModel, target_node: NodeModel) -> bool:
+        """
+        Check whether a new edge would create a cycle, updating the topological index.
+
+        Args:
+            source_node: The node the new edge starts from
+            target_node: The node the new edge points to
+
+        Returns:
+            True if the edge would create a cycle
+        """
+        if self._topo_index_stale:
+            try:
+                self._rebuild_topo_index()
+            except ValueError:
+                # Already cyclic (through connect_to()), fall back to a reachability search
+                return self._reaches(target_node.id, source_node.id)
+
+        return not self._order_edge(source_node, target_node)
+
+    def _reaches(self, start_id: int, goal_id: int) -> bool:
+        """Check whether goal_id can be reached from start_id along child edges."""
+        visited = {start_id}
+        to_visit = [start_id]
+        while to_visit:
+            node_id = to_visit.pop()
+            if node_id == goal_id:
+                return True
+            for child_id in self._children[node_id]:
+                if child_id not in visited:
+                    visited.add(child_id)
+                    to_visit.append(child_id)
+        return False
+
+    def _connector_connected(self, source: ConnectorModel, target: ConnectorModel) -> None:
+        """
+        Record a connection made between two connectors of this network.
+
+        Called by ConnectorModel.connect_to(), so connections made directly on the
+        connectors are part of the adjacency too.
+
+        Args:
+            source: The output connector
+            target: The input connector
+        """
+        if (id(source), id(target)) in self._connector_pairs:
+            return
+        # Nodes that point at this network but are not added yet (e.g. while deserializing)
+        if source.node.id not in self._nodes or target.node.id not in self._nodes:
+            return
+
+        self._register_connection(source, target)
+        if not self._topo_index_stale and not self._order_edge(source.node, target.node):
+            # Only possible when connect() is bypassed, the network now has a cycle
+            self._topo_index_stale = True
+        self._topology_changed()
+
+    def _connector_disconnected(self, source: ConnectorModel, target: ConnectorModel) -> None:
+        """
+        Forget a connection removed between two connectors of this network.
+
+        Called by ConnectorModel.disconnect_from().
+
+        Args:
+            source: The output connector
+            target: The input connector
+        """
+        if (id(source), id(target)) in self._connector_pairs:
+            self._unregister_connection(source, target)
+            self._topology_changed()
+
+    def _order_edge(self, source_node: NodeModel, target_node: NodeModel) -> bool:
+        """
+        Update the incremental topological index for a new edge.
+
+        Uses the Pearce-Kelly online ordering algorithm: if the target is already
+        ordered after the source nothing needs to be done. Otherwise only the nodes
+        whose index lies between target and source are searched and reordered.
+
+        Args:
+            source_node: The node the new edge starts from
+            target_node: The node the new edge points to
+
+        Returns:
+            True if the index was updated, False if the edge would create a cycle
+        """
+        index = self._topo_index
+        lower = index[target_node.id]
+        upper = index[source_node.id]
+
+        if lower > upper:
+            return True
+
+        # Nodes reachable from the target within the affected band
+        forward = []
+        visited = {target_node.id}
+        to_visit = [target_node]
+        while to_visit:
+            current = to_visit.pop()
+            forward.append(current)
+            for child in self.find_child_nodes(current):
+                if child.id == source_node.id:
+                    return False
+                if child.id not in visited and index[child.id] < upper:
+                    visited.add(child.id)
+                    to_visit.append(child)
+
+        # Nodes reaching the source within the affected band
+        backward = []
+        visited = {source_node.id}
+        to_visit = [source_node]
+        while to_visit:
+            current = to_visit.pop()
+            backward.append(current)
+            for parent in self.find_parent_nodes(current):
+                if parent.id not in visited and index[parent.id] > lower:
+                    visited.add(parent.id)
+                    to_visit.append(parent)
+
+        # Reassign the freed indices: source's ancestors first, then target's descendants
+        backward.sort(key=lambda node: index[node.id])
+        forward.sort(key=lambda node: index[node.id])
+        affected = backward + forward
+        slots = sorted(index[node.id] for node in affected)
+        for node, slot in zip(affected, slots):
+            index[node.id] = slot
+
+        return True
+
     def disconnect(
         self,
-        source_node_id: UUID,
+        source_node_id: int,
         source_output: str,
-        target_node_id: UUID,
+        target_node_id: int,
         target_input: str
     ) -> bool:
         """
@@ -227,31 +516,97 @@ class NetworkModel:
         if not source_connector or not target_connector:
             return False
 
+        # The connectors report the removal back through _connector_disconnected()
         success = source_connector.disconnect_from(target_connector)
 
-        if success:
-            # Remove from connector_pairs
-            self._connector_pairs = [
-                (src, tgt) for src, tgt in self._connector_pairs
-                if not (src is source_connector and tgt is target_connector)
-            ]
-
+        if success and not self._signals_blocked:
             self.connection_removed.emit(source_connector, target_connector)
             self.network_changed.emit()
 
         return success
 
-    def connector_pairs(self) -> List[Tuple[ConnectorModel, ConnectorModel]]:
+    def _register_connection(self, source: ConnectorModel, target: ConnectorModel) -> None:
+        """Record a connection and update the node adjacency."""
+        self._connector_pairs[(id(source), id(target))] = (source, target)
+
+        source_id = source.node.id
+        target_id = target.node.id
+        children = self._children[source_id]
+        children[target_id] = children.get(target_id, 0) + 1
+        parents = self._parents[target_id]
+        parents[source_id] = parents.get(source_id, 0) + 1
+
+    def _unregister_connection(self, source: ConnectorModel, target: ConnectorModel) -> None:
+        """Forget a connection and update the node adjacency."""
+        if self._connector_pairs.pop((id(source), id(target)), None) is None:
+            return
+
+        source_id = source.node.id
+        target_id = target.node.id
+        for counts, node_id, other_id in (
+            (self._children, source_id, target_id),
+            (self._parents, target_id, source_id),
+        ):
+            neighbours = counts[node_id]
+            if neighbours[other_id] > 1:
+                neighbours[other_id] -= 1
+            else:
+                del neighbours[other_id]
+
+    def connector_pairs(self) -> ValuesView[Tuple[ConnectorModel, ConnectorModel]]:
         """
         Get all connections in the network.
 
+        The returned view is live and read-only. Copy it with ``list()`` before
+        connecting or disconnecting while iterating over it.
+
         Returns:
-            List of (output_connector, input_connector) tuples
+            View of (output_connector, input_connector) tuples in insertion order
         """
-        return self._connector_pairs.copy()
+        return self._connector_pairs.values()
+
+    def iter_connector_pairs(self) -> Iterator[Tuple[ConnectorModel, ConnectorModel]]:
+        """
+        Iterate over all connections without copying them.
+
+        Returns:
+            Iterator of (output_connector, input_connector) tuples
+        """
+        return iter(self._connector_pairs.values())
 
     # Execution
 
+    def topological_order(self) -> List[NodeModel]:
+        """
+        Get all nodes in topological order.
+
+        The order is computed with Kahn's algorithm and cached until the
+        network topology changes (nodes added/removed, connections changed).
+
+        Returns:
+            List of nodes, parents before children (shared, do not modify)
+
+        Raises:
+            ValueError: If the network contains a cycle
+        """
+        if self._topo_dirty or self._topo_cache is None:
+            order, in_degree = self._kahn_sort()
+
+            if len(order) != len(self._nodes):
+                cyclic_nodes = [
+                    self._nodes[node_id].name
+                    for node_id, degree in in_degree.items() if degree > 0
+                ]
+                raise ValueError(
+                    f"Cyclic dependency detected in network '{self.name}'. "
+                    f"Nodes in cycle: {', '.join(cyclic_nodes)}."
+                )
+
+            self._topo_cache = order
+            self._topo_dirty = False
+
+        return self._topo_cache
+
     def get_execution_order(self) -> List[NodeModel]:
         """
         Get nodes in topological execution order.
@@ -272,7 +627,7 @@ class NetworkModel:
         for node in nodes:
             has_downstream = any(
                 output_conn.is_connected()
-                for output_conn in node.outputs().values()
+                for output_conn in node._outputs_view.values()
             )
             if not has_downstream:
                 terminal_nodes.append(node)
@@ -305,6 +660,61 @@ class NetworkModel:
 
         return result
 
+    def execution_levels(self) -> List[List[NodeModel]]:
+        """
+        Group nodes into levels that can be cooked independently.
+
+        A node's level is the length of the longest path from any root node to
+        it, so nodes within a level never depend on each other.
+
+        Returns:
+            List of levels, each a list of nodes
+
+        Raises:
+            ValueError: If the network contains a cycle
+        """
+        depth: Dict[int, int] = {}
+        levels: List[List[NodeModel]] = []
+
+        for node in self.topological_order():
+            key = node.id
+            node_depth = max((depth[parent] + 1 for parent in self._parents[key]), default=0)
+            depth[key] = node_depth
+
+            if node_depth == len(levels):
+                levels.append([])
+            levels[node_depth].append(node)
+
+        return levels
+
+    def execute(self, max_workers: Optional[int] = None) -> bool:
+        """
+        Cook all nodes in the network, level by level.
+
+        Nodes within a level are cooked concurrently on a thread pool, and each
+        level waits for the previous one to finish. This pays off for nodes
+        that release the GIL (I/O, numpy, C extensions).
+
+        Args:
+            max_workers: Maximum number of threads (None uses the executor default)
+
+        Returns:
+            True if execution was successful, False if error occurred
+        """
+        try:
+            levels = self.execution_levels()
+        except ValueError as e:
+            logger.error("Cannot execute network %s: %s", self.name, e)
+            return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in levels:
+                results = list(executor.map(lambda node: node.cook(), level))
+                if not all(results):
+                    return False
+
+        return True
+
     def mark_all_dirty(self) -> None:
         """Mark all nodes as dirty."""
         for node in self._nodes.values():
@@ -314,59 +724,63 @@ class NetworkModel:
 
     def clear(self) -> None:
         """Remove all nodes and connections."""
-        self._connector_pairs.clear()
-        node_ids = list(self._nodes.keys())
-        for node_id in node_ids:
-            self.remove_node(node_id)
+        for node in list(self._nodes.values()):
+            self.remove_node(node.id)
 
     def find_parent_nodes(self, node: NodeModel) -> List[NodeModel]:
         """Find all parent nodes (nodes feeding into this node)."""
-        parents = []
-
-        for input_conn in node.inputs().values():
-            for connected_output in input_conn.connections():
-                if connected_output.node and connected_output.node not in parents:
-                    parents.append(connected_output.node)
+        return [self._nodes[parent_id] for parent_id in self._parents.get(node.id, ())]
 
-        return parents
+    def iter_parent_nodes(self, node: NodeModel) -> Iterator[NodeModel]:
+        """Iterate over parent nodes without building a list."""
+        nodes = self._nodes
+        for parent_id in self._parents.get(node.id, ()):
+            yield nodes[parent_id]
 
     def find_child_nodes(self, node: NodeModel) -> List[NodeModel]:
         """Find all child nodes (nodes fed by this node)."""
-        children = []
-
-        for output_conn in node.outputs().values():
-            for connected_input in output_conn.connections():
-                if connected_input.node and connected_input.node not in children:
-                    children.append(connected_input.node)
-
-        return children
+        return [self._nodes[child_id] for child_id in self._children.get(node.id, ())]
 
     def has_cycle(self) -> bool:
         """Check if the network contains any cycles."""
-        visited = set()
-        rec_stack = set()
-
-        def visit(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-
-            node = self._nodes[node_id]
-            for child in self.find_child_nodes(node):
-                if child.id not in visited:
-                    if visit(child.id):
-                        return True
-                elif child.id in rec_stack:
-                    return True
-
-            rec_stack.remove(node_id)
-            return False
+        order, _ = self._kahn_sort()
+        return len(order) != len(self._nodes)
 
-        for node_id in self._nodes:
-            if node_id not in visited:
-                if visit(node_id):
-                    return True
+    def _kahn_sort(self) -> Tuple[List[NodeModel], Dict[int, int]]:
+        """
+        Sort nodes with Kahn's algorithm over the cached adjacency.
 
-        return False
+        Returns:
+            Tuple of (sorted nodes, remaining in-degree per node key). The sorted
+            list is shorter than the node count if the network contains a cycle.
+        """
+        in_degree = {node_id: len(parents) for node_id, parents in self._parents.items()}
+        # Any ready node may come next, so a plain list used as a stack will do
+        ready = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        order = []
+
+        while ready:
+            node_id = ready.pop()
+            order.append(self._nodes[node_id])
+
+            for child_id in self._children[node_id]:
+                in_degree[child_id] -= 1
+                if in_degree[child_id] == 0:
+                    ready.append(child_id)
+
+        return order, in_degree
+
+    def _rebuild_topo_index(self) -> None:
+        """
+        Rebuild the incremental topological index from a full sort.
+
+        Raises:
+            ValueError: If the network contains a cycle
+        """
+        order = self.topological_order()
+        self._topo_index = {node.id: index for index, node in enumerate(order)}
+        self._next_topo_index = len(order)
+        self._topo_index_stale = False
 
     # Serialization
 
@@ -379,12 +793,12 @@ class NetworkModel:
             ],
             "connections": [
                 {
-                    "source_node": str(src.node.id) if src.node else None,
+                    "source_node": str(src.node.uuid) if src.node else None,
                     "source_output": src.name,
-                    "target_node": str(tgt.node.id) if tgt.node else None,
+                    "target_node": str(tgt.node.uuid) if tgt.node else None,
                     "target_input": tgt.name,
                 }
-                for src, tgt in self.connector_pairs()
+                for src, tgt in self.iter_connector_pairs()
             ],
         }
 
@@ -393,29 +807,38 @@ class NetworkModel:
         """Deserialize network from dictionary."""
         network = cls(name=data.get("name", "Network"))
 
-        # First, create all nodes
-        node_map = {}
-        for node_data in data.get("nodes", []):
-            node = NodeModel.deserialize(node_data, network)
-            network.add_node(node)
-            node_map[node.id] = node
-
-        # Then, recreate connections
-        for conn_data in data.get("connections", []):
-            # Convert string IDs back to UUID
-            source_id = conn_data["source_node"]
-            target_id = conn_data["target_node"]
-            if isinstance(source_id, str):
-                source_id = UUID(source_id)
-            if isinstance(target_id, str):
-                target_id = UUID(target_id)
-
-            network.connect(
-                source_node_id=source_id,
-                source_output=conn_data["source_output"],
-                target_node_id=target_id,
-                target_input=conn_data["target_input"],
-            )
+        with network.batch():
+            # First, create all nodes
+            for node_data in data.get("nodes", []):
+                node = NodeModel.deserialize(node_data, network)
+                network.add_node(node)
+
+            # Then, recreate connections. Serialized data comes from a valid network,
+            # so edges are added without per-edge cycle checks and the whole graph is
+            # validated once at the end.
+            network._topo_index_stale = True
+            for conn_data in data.get("connections", []):
+                # Convert string IDs back to UUID
+                source_id = conn_data["source_node"]
+                target_id = conn_data["target_node"]
+                if isinstance(source_id, str):
+                    source_id = UUID(source_id)
+                if isinstance(target_id, str):
+                    target_id = UUID(target_id)
+
+                source_node = network.get_node_by_uuid(source_id)
+                target_node = network.get_node_by_uuid(target_id)
+
+                if not source_node or not target_node:
+                    continue
+
+                source_connector = source_node.output(conn_data["source_output"])
+                target_connector = target_node.input(conn_data["target_input"])
+
+                if source_connector and target_connector:
+                    network._add_connection(source_connector, target_connector)
+
+            network._rebuild_topo_index()
 
         return network
 
@@ -7,9 +7,13 @@ Nodes are the fundamental building blocks that process data.
 """
 
 from pydantic import BaseModel, Field, PrivateAttr
-from typing import Dict, Any, Optional, TYPE_CHECKING, Tuple, List
+from typing import Dict, Any, Iterator, Mapping, Optional, TYPE_CHECKING, Tuple, List
+from types import MappingProxyType
 from uuid import uuid4, UUID
-from collections import defaultdict, deque
+from itertools import count
+from collections import OrderedDict
+import logging
+import threading
 
 from .connector_model import ConnectorModel, ConnectorType
 from .parameter_model import ParameterModel
@@ -18,6 +22,14 @@ from ..signals import Signal
 if TYPE_CHECKING:
     from .network_model import NetworkModel
 
+logger = logging.getLogger(__name__)
+
+# In-process node ids, plain ints are cheaper to create and hash than UUIDs
+_next_node_id = count(1).__next__
+
+# Number of cook results remembered per node, see NodeModel.cook()
+_COOK_MEMO_SIZE = 16
+
 
 class NodeModel(BaseModel):
     """
@@ -27,7 +39,8 @@ class NodeModel(BaseModel):
     and parameters that control their behavior. Similar to Houdini's nodes.
 
     Attributes:
-        id: Unique node identifier (UUID)
+        id: Unique in-process node identifier
+        uuid: Persistent node identifier, used for serialization
         name: Node display name
         node_type: Type of node (e.g., "AddNode", "SubnetNode")
         category: Category for organization (e.g., "Math", "Logic")
@@ -40,7 +53,8 @@ class NodeModel(BaseModel):
         position_changed: Signal emitted when position changes
     """
 
-    id: UUID = Field(default_factory=uuid4)
+    id: int = Field(default_factory=_next_node_id)
+    uuid: UUID = Field(default_factory=uuid4)
     name: str = "Node"
     node_type: str = "BaseNode"
     category: str = "General"
@@ -49,17 +63,36 @@ class NodeModel(BaseModel):
     enable_caching: bool = False
 
     # Private attributes
-    _position: Tuple[float, float] = PrivateAttr(default=(0.0, 0.0))
+    # Position is stored as two floats, set_position() runs on every drag event
+    _position_x: float = PrivateAttr(default=0.0)
+    _position_y: float = PrivateAttr(default=0.0)
     _parameters: Dict[str, ParameterModel] = PrivateAttr(default_factory=dict)
     _inputs: Dict[str, ConnectorModel] = PrivateAttr(default_factory=dict)
     _outputs: Dict[str, ConnectorModel] = PrivateAttr(default_factory=dict)
+    # Read-only live views for internal callers that only iterate
+    _parameters_view: Mapping[str, ParameterModel] = PrivateAttr(default=None)
+    _inputs_view: Mapping[str, ConnectorModel] = PrivateAttr(default=None)
+    _outputs_view: Mapping[str, ConnectorModel] = PrivateAttr(default=None)
     _is_dirty: bool = PrivateAttr(default=True)
     _is_cooking: bool = PrivateAttr(default=False)
-    _cached_outputs: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _cook_lock: Any = PrivateAttr(default_factory=threading.RLock)  # Reentrant, see cook()
+    _cached_outputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)  # Set on first cook
+    # Input values for the current cook, reused between cooks
+    _input_scratch: Optional[Dict[str, Any]] = PrivateAttr(default=None)  # Created on first cook
+    # Recent cook results keyed by input and parameter values (LRU, caching only)
+    _cook_memo: Optional["OrderedDict[tuple, Dict[str, Any]]"] = PrivateAttr(default=None)  # Created on first store
     _cook_error: Optional[str] = PrivateAttr(default=None)
-    _dirty_changed: Signal = PrivateAttr(default=None)
-    _position_changed: Signal = PrivateAttr(default=None)
-    _parameter_changed: Signal = PrivateAttr(default=None)
+    _exec_order_cache: Optional[List["NodeModel"]] = PrivateAttr(default=None)
+    _exec_order_version: int = PrivateAttr(default=-1)
+    # Parent/child lists, valid while the network topology version matches
+    _parent_cache: Optional[List["NodeModel"]] = PrivateAttr(default=None)
+    _parent_cache_version: int = PrivateAttr(default=-1)
+    _child_cache: Optional[List["NodeModel"]] = PrivateAttr(default=None)
+    _child_cache_version: int = PrivateAttr(default=-1)
+    # Signals are created on first access, most nodes never get subscribers
+    _dirty_changed: Optional[Signal] = PrivateAttr(default=None)
+    _position_changed: Optional[Signal] = PrivateAttr(default=None)
+    _parameter_changed: Optional[Signal] = PrivateAttr(default=None)
 
     model_config = {
         "arbitrary_types_allowed": True,  # Allow Signal and custom types
@@ -67,35 +100,50 @@ class NodeModel(BaseModel):
 
     def model_post_init(self, __context) -> None:
         """Initialize fields after Pydantic validation."""
-        self._dirty_changed = Signal()
-        self._position_changed = Signal()
-        self._parameter_changed = Signal()
+        self._parameters_view = MappingProxyType(self._parameters)
+        self._inputs_view = MappingProxyType(self._inputs)
+        self._outputs_view = MappingProxyType(self._outputs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, keeping the network's name index in sync on renames."""
+        if name == "name" and self.network is not None and value != self.name:
+            value = self.network._node_renamed(self, value)
+        super().__setattr__(name, value)
 
     @property
     def dirty_changed(self) -> Signal:
         """Get dirty_changed signal."""
+        if self._dirty_changed is None:
+            self._dirty_changed = Signal()
         return self._dirty_changed
 
     @property
     def position_changed(self) -> Signal:
         """Get position_changed signal."""
+        if self._position_changed is None:
+            self._position_changed = Signal()
         return self._position_changed
 
     @property
     def parameter_changed(self) -> Signal:
         """Get parameter_changed signal."""
+        if self._parameter_changed is None:
+            self._parameter_changed = Signal()
         return self._parameter_changed
 
     def position(self) -> Tuple[float, float]:
         """Get node position."""
-        return self._position
+        return (self._position_x, self._position_y)
 
     def set_position(self, x: float, y: float, emit_signal: bool = True) -> None:
         """Set node position."""
-        old_pos = self._position
-        self._position = (x, y)
+        if x == self._position_x and y == self._position_y:
+            return
 
-        if emit_signal and old_pos != self._position:
+        self._position_x = x
+        self._position_y = y
+
+        if emit_signal and self._position_changed is not None:
             self._position_changed.emit(x, y)
 
     # Parameter management
@@ -108,7 +156,9 @@ class NodeModel(BaseModel):
         **kwargs
     ) -> ParameterModel:
         """Add a parameter to this node."""
-        param = ParameterModel(
+        # Field values come from the node definition, skip validation.
+        # model_construct still runs model_post_init.
+        param = ParameterModel.model_construct(
             name=name,
             data_type=data_type,
             default_value=default_value,
@@ -126,13 +176,14 @@ class NodeModel(BaseModel):
         return self._parameters.get(name)
 
     def parameters(self) -> Dict[str, ParameterModel]:
-        """Get all parameters."""
+        """Get all parameters (copy, internal callers iterate _parameters_view)."""
         return self._parameters.copy()
 
     def _on_parameter_changed(self, value: Any) -> None:
         """Handle parameter value changes."""
-        self.mark_dirty()
-        self._parameter_changed.emit()
+        self._mark_dirty()
+        if self._parameter_changed is not None:
+            self._parameter_changed.emit()
 
     # Connector management
 
@@ -144,7 +195,7 @@ class NodeModel(BaseModel):
         **kwargs
     ) -> ConnectorModel:
         """Add an input connector to this node."""
-        connector = ConnectorModel(
+        connector = ConnectorModel.model_construct(
             name=name,
             connector_type=ConnectorType.INPUT,
             data_type=data_type,
@@ -155,7 +206,7 @@ class NodeModel(BaseModel):
         self._inputs[name] = connector
 
         # Connect to mark node dirty when connection changes
-        connector.connected_changed.connect(self.mark_dirty)
+        connector.connected_changed.connect(self._mark_dirty)
 
         return connector
 
@@ -166,7 +217,7 @@ class NodeModel(BaseModel):
         **kwargs
     ) -> ConnectorModel:
         """Add an output connector to this node."""
-        connector = ConnectorModel(
+        connector = ConnectorModel.model_construct(
             name=name,
             connector_type=ConnectorType.OUTPUT,
             data_type=data_type,
@@ -186,42 +237,85 @@ class NodeModel(BaseModel):
         return self._outputs.get(name)
 
     def inputs(self) -> Dict[str, ConnectorModel]:
-        """Get all input connectors."""
+        """Get all input connectors (copy, internal callers iterate _inputs_view)."""
         return self._inputs.copy()
 
     def outputs(self) -> Dict[str, ConnectorModel]:
-        """Get all output connectors."""
+        """Get all output connectors (copy, internal callers iterate _outputs_view)."""
         return self._outputs.copy()
 
     def get_parent_nodes(self) -> list:
-        """Get all parent nodes (nodes feeding into this node)."""
-        if self.network is None:
+        """
+        Get all parent nodes (nodes feeding into this node).
+
+        The list is cached until the network topology version changes.
+
+        Returns:
+            List of parent nodes (shared, do not modify)
+        """
+        network = self.network
+        if network is None:
             return []
-        return self.network.find_parent_nodes(self)
+
+        version = network.topology_version()
+        if self._parent_cache is None or self._parent_cache_version != version:
+            self._parent_cache = network.find_parent_nodes(self)
+            self._parent_cache_version = version
+        return self._parent_cache
+
+    def iter_parent_nodes(self) -> Iterator["NodeModel"]:
+        """Iterate over parent nodes without building a list."""
+        if self.network is not None:
+            yield from self.network.iter_parent_nodes(self)
 
     def get_child_nodes(self) -> list:
-        """Get all child nodes (nodes fed by this node)."""
-        if self.network is None:
+        """
+        Get all child nodes (nodes fed by this node).
+
+        The list is cached until the network topology version changes.
+
+        Returns:
+            List of child nodes (shared, do not modify)
+        """
+        network = self.network
+        if network is None:
             return []
-        return self.network.find_child_nodes(self)
+
+        version = network.topology_version()
+        if self._child_cache is None or self._child_cache_version != version:
+            self._child_cache = network.find_child_nodes(self)
+            self._child_cache_version = version
+        return self._child_cache
 
     # Execution (cooking)
 
     def mark_dirty(self) -> None:
-        """Mark this node as dirty (needs recomputation)."""
+        """
+        Mark this node as dirty (needs recomputation).
+
+        An explicit call also drops the memoized cook results, so the next cook
+        always runs _cook_internal (e.g. for nodes reading files, time or RNG).
+        """
+        self._cook_memo = None
+        self._mark_dirty()
+
+    def _mark_dirty(self, *args) -> None:
+        """Mark dirty because an input, parameter or connection changed, keeping the cook memo."""
         if not self.enable_caching:
             return  # Skip dirty state tracking when caching is disabled
 
         if not self._is_dirty:
             self._is_dirty = True
-            self._cached_outputs.clear()
+            # Rebind rather than clear, the outputs may be shared with the cook memo
+            self._cached_outputs = None
             self._cook_error = None
 
             # Propagate dirty state to outputs
             for output in self._outputs.values():
                 output.mark_dirty()
 
-            self._dirty_changed.emit(True)
+            if self._dirty_changed is not None:
+                self._dirty_changed.emit(True)
 
     def is_dirty(self) -> bool:
         """Check if node needs recomputation."""
@@ -236,52 +330,98 @@ class NodeModel(BaseModel):
         Returns:
             True if cooking was successful, False if error occurred
         """
-        # Skip cache check if caching is disabled (always recompute)
-        if self.enable_caching:
-            if not self._is_dirty and self._cached_outputs:
-                return True  # Already up-to-date
-
-        if self._is_cooking:
-            return False  # Prevent recursion
+        # Sibling nodes cook on separate threads during NetworkModel.execute() and
+        # may pull the same parent through get_value(), so cooks of a node are serialized
+        with self._cook_lock:
+            # Skip cache check if caching is disabled (always recompute)
+            if self.enable_caching:
+                if not self._is_dirty and self._cached_outputs:
+                    return True  # Already up-to-date
 
-        self._is_cooking = True
-        self._cook_error = None
+            if self._is_cooking:
+                return False  # Prevent recursion
 
-        try:
-            # Gather input values
-            input_values = {}
-            for name, connector in self._inputs.items():
-                input_values[name] = connector.get_value()
+            self._is_cooking = True
+            self._cook_error = None
 
-            output_values = self._cook_internal(**input_values)
+            try:
+                # Gather input values
+                input_values = self._input_scratch
+                if input_values is None:
+                    input_values = self._input_scratch = {}
+                else:
+                    input_values.clear()
+                for name, connector in self._inputs.items():
+                    input_values[name] = connector.get_value()
+
+                # Reuse an earlier result when inputs and parameters are unchanged
+                memo = self._cook_memo
+                memo_key = self._cook_memo_key(input_values) if self.enable_caching else None
+                if memo_key is not None and memo is not None and memo_key in memo:
+                    memo.move_to_end(memo_key)
+                    output_values = memo[memo_key]
+                else:
+                    output_values = self._cook_internal(input_values)
+
+                    # Store outputs (even if empty dict)
+                    if output_values is None:
+                        output_values = {}
+
+                    if memo_key is not None:
+                        if memo is None:
+                            memo = self._cook_memo = OrderedDict()
+                        memo[memo_key] = output_values
+                        if len(memo) > _COOK_MEMO_SIZE:
+                            memo.popitem(last=False)
 
-            # Store outputs (even if empty dict)
-            if output_values is not None:
                 self._cached_outputs = output_values
-            else:
-                self._cached_outputs = {}
 
-            # Mark as clean (only if caching is enabled)
-            if self.enable_caching:
-                self._is_dirty = False
-                self._dirty_changed.emit(False)
+                # Mark as clean (only if caching is enabled)
+                if self.enable_caching:
+                    self._is_dirty = False
+                    if self._dirty_changed is not None:
+                        self._dirty_changed.emit(False)
 
-            return True
+                return True
 
-        except Exception as e:
-            self._cook_error = str(e)
-            print(f"Error cooking node {self.name}: {e}")
-            return False
+            except Exception as e:
+                self._cook_error = str(e)
+                logger.error("Error cooking node %s: %s", self.name, e)
+                return False
 
-        finally:
-            self._is_cooking = False
+            finally:
+                self._is_cooking = False
 
-    def _cook_internal(self, **inputs) -> Dict[str, Any]:
+    def _cook_memo_key(self, input_values: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the cook memo key from input and parameter values.
+
+        Args:
+            input_values: Dictionary of input values
+
+        Returns:
+            Hashable key, or None if any value is unhashable
+        """
+        # Types are part of the key so that e.g. 1, 1.0 and True stay distinct
+        key = (
+            tuple((name, type(value), value) for name, value in input_values.items()),
+            tuple(
+                (name, type(param._value), param._value)
+                for name, param in self._parameters.items()
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _cook_internal(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
         Internal cook method to be overridden by subclasses.
 
         Args:
-            **inputs: Dictionary of input values
+            inputs: Dictionary of input values, reused between cooks (do not keep a reference)
 
         Returns:
             Dictionary of output values
@@ -306,46 +446,29 @@ class NodeModel(BaseModel):
         try:
             nodes_to_cook = self._get_local_execution_order()
         except ValueError as e:
-            print(f"Error: Cannot execute node {self.name}: {e}")
+            logger.error("Cannot execute node %s: %s", self.name, e)
             return False
 
         # Cook nodes in order
-        for node in nodes_to_cook:
-            if not self.enable_caching or node.is_dirty():
+        if self.enable_caching:
+            # Inlined is_dirty(), _is_dirty can be stale on a node whose
+            # caching was turned off after it cooked
+            for node in nodes_to_cook:
+                if (node._is_dirty or not node.enable_caching) and not node.cook():
+                    return False
+        else:
+            for node in nodes_to_cook:
                 if not node.cook():
                     return False
 
         return True
 
-    def _get_all_ancestors(self) -> List["NodeModel"]:
-        """
-        Get all ancestor nodes (recursive parent traversal).
-
-        Returns:
-            List of all ancestor nodes
-        """
-        ancestors = []
-        visited = set()
-        to_visit = list(self.get_parent_nodes())
-
-        while to_visit:
-            current = to_visit.pop()
-            if current.id in visited:
-                continue
-            visited.add(current.id)
-            ancestors.append(current)
-
-            for parent in current.get_parent_nodes():
-                if parent.id not in visited:
-                    to_visit.append(parent)
-
-        return ancestors
-
     def _get_local_execution_order(self) -> List["NodeModel"]:
         """
         Get execution order for this node and its ancestors using local topological sort.
 
-        Uses Kahn's algorithm on the subset of nodes (ancestors + self).
+        Uses an iterative depth-first search over parent connections.
+        The result is cached until the network topology version changes.
 
         Returns:
             List of nodes in execution order
@@ -353,44 +476,48 @@ class NodeModel(BaseModel):
         Raises:
             ValueError: If cyclic dependency is detected
         """
-        # Get all ancestors + self
-        ancestors = self._get_all_ancestors()
-        nodes = ancestors + [self]
-        node_ids = {node.id for node in nodes}
-
-        # Build adjacency list and in-degree count (only within subset)
-        in_degree = defaultdict(int)
-        adjacency = defaultdict(list)
-
-        for node in nodes:
-            if node.id not in in_degree:
-                in_degree[node.id] = 0
-
-            for output_conn in node.outputs().values():
-                for connected_input in output_conn.connections():
-                    if connected_input.node and connected_input.node.id in node_ids:
-                        target_id = connected_input.node.id
-                        adjacency[node.id].append(target_id)
-                        in_degree[target_id] += 1
-
-        # Kahn's algorithm (topological sort)
-        node_map = {node.id: node for node in nodes}
-        queue = deque(node.id for node in nodes if in_degree[node.id] == 0)
+        network = self.network
+        if (
+            network is not None
+            and self._exec_order_cache is not None
+            and self._exec_order_version == network.topology_version()
+        ):
+            return self._exec_order_cache
+
+        # Iterative DFS over parent edges: a node is emitted after all of its
+        # parents (postorder), which is a valid execution order for a DAG.
         sorted_nodes = []
+        visited = set()
+        on_stack = set()
+        stack = [(self, False)]
+
+        while stack:
+            node, processed = stack.pop()
 
-        while queue:
-            node_id = queue.popleft()
-            sorted_nodes.append(node_map[node_id])
+            if processed:
+                on_stack.discard(node.id)
+                sorted_nodes.append(node)
+                continue
 
-            for neighbor_id in adjacency[node_id]:
-                in_degree[neighbor_id] -= 1
-                if in_degree[neighbor_id] == 0:
-                    queue.append(neighbor_id)
+            if node.id in on_stack:
+                # Reached a node that is still being visited: the nodes on the
+                # current path from it onwards form a cycle
+                path = [current for current, done in stack if done]
+                start = next(i for i, current in enumerate(path) if current.id == node.id)
+                cyclic_nodes = [current.name for current in path[start:]]
+                raise ValueError(f"Cyclic dependency detected in nodes: {', '.join(cyclic_nodes)}")
 
-        # Check for cycles
-        if len(sorted_nodes) != len(nodes):
-            cyclic_nodes = [node.name for node in nodes if node not in sorted_nodes]
-            raise ValueError(f"Cyclic dependency detected in nodes: {', '.join(cyclic_nodes)}")
+            if node.id in visited:
+                continue
+
+            visited.add(node.id)
+            on_stack.add(node.id)
+            stack.append((node, True))
+            stack.extend((parent, False) for parent in node.iter_parent_nodes())
+
+        if network is not None:
+            self._exec_order_cache = sorted_nodes
+            self._exec_order_version = network.topology_version()
 
         return sorted_nodes
 
@@ -399,6 +526,8 @@ class NodeModel(BaseModel):
         if self._is_dirty:
             self.cook()
 
+        if self._cached_outputs is None:
+            return None
         return self._cached_outputs.get(output_name)
 
     # Serialization
@@ -407,49 +536,67 @@ class NodeModel(BaseModel):
         """
         Serialize node to dictionary.
 
-        Uses Pydantic's model_dump() which automatically excludes non-serializable fields.
+        Built by hand rather than with model_dump(), all fields are already
+        JSON-compatible apart from the UUID. Only the persistent id is stored.
+        Fields declared by subclasses are added with model_dump().
         """
-        data = self.model_dump(mode="json")
-        data["position"] = self._position
-
-        # Serialize parameters
-        data["parameters"] = {
-            name: param.serialize()
-            for name, param in self._parameters.items()
+        data = {
+            "id": str(self.uuid),
+            "name": self.name,
+            "node_type": self.node_type,
+            "category": self.category,
+            "color": self.color,
+            "enable_caching": self.enable_caching,
+            "position": (self._position_x, self._position_y),
+            # Serialize parameters
+            "parameters": {
+                name: param.serialize()
+                for name, param in self._parameters.items()
+            },
+            # Serialize connectors
+            "inputs": {
+                name: conn.serialize()
+                for name, conn in self._inputs.items()
+            },
+            "outputs": {
+                name: conn.serialize()
+                for name, conn in self._outputs.items()
+            },
         }
 
-        # Serialize connectors
-        data["inputs"] = {
-            name: conn.serialize()
-            for name, conn in self._inputs.items()
-        }
-
-        data["outputs"] = {
-            name: conn.serialize()
-            for name, conn in self._outputs.items()
-        }
+        extra_fields = type(self).model_fields.keys() - NodeModel.model_fields.keys()
+        if extra_fields:
+            data.update(self.model_dump(mode="json", include=extra_fields))
 
         return data
 
     @classmethod
     def deserialize(cls, data: dict, network: Optional["NetworkModel"] = None) -> "NodeModel":
         """Deserialize node from dictionary."""
-        node_id = data.get("id", uuid4())
-        if isinstance(node_id, str):
-            node_id = UUID(node_id)
+        # "id" holds the persistent UUID, the in-process id is always new
+        node_uuid = data.get("id", uuid4())
+        if isinstance(node_uuid, str):
+            node_uuid = UUID(node_uuid)
+        elif isinstance(node_uuid, int):
+            node_uuid = UUID(int=node_uuid)
 
         node_data = {
             "name": data.get("name", "Node"),
             "node_type": data.get("node_type", "BaseNode"),
             "category": data.get("category", "General"),
-            "id": node_id,
+            "uuid": node_uuid,
             "color": data.get("color"),
         }
 
+        # Fields declared by subclasses
+        for name in cls.model_fields.keys() - NodeModel.model_fields.keys():
+            if name in data:
+                node_data[name] = data[name]
+
         node = cls.model_validate(node_data)
         node.network = network
 
-        node._position = data.get("position", (0.0, 0.0))
+        node._position_x, node._position_y = data.get("position", (0.0, 0.0))
 
         # Deserialize parameters
         for name, param_data in data.get("parameters", {}).items():
@@ -461,7 +608,7 @@ class NodeModel(BaseModel):
         for name, conn_data in data.get("inputs", {}).items():
             conn = ConnectorModel.deserialize(conn_data, node)
             node._inputs[name] = conn
-            conn.connected_changed.connect(node.mark_dirty)
+            conn.connected_changed.connect(node._mark_dirty)
 
         for name, conn_data in data.get("outputs", {}).items():
             conn = ConnectorModel.deserialize(conn_data, node)
@@ -470,4 +617,4 @@ class NodeModel(BaseModel):
         return node
 
     def __repr__(self) -> str:
-        return f"NodeModel(id='{str(self.id)[:8]}...', name='{self.name}', type='{self.node_type}')"
+        return f"NodeModel(id={self.id}, name='{self.name}', type='{self.node_type}')"
@@ -37,7 +37,7 @@ class ParameterModel(BaseModel):
 
     # Private attributes (using PrivateAttr for Pydantic V2)
     _value: Any = PrivateAttr(default=None)
-    _value_changed: Signal = PrivateAttr(default=None)
+    _value_changed: Optional[Signal] = PrivateAttr(default=None)  # Created on first access
 
     model_config = {
         "arbitrary_types_allowed": True,  # Allow Signal type
@@ -54,11 +54,11 @@ class ParameterModel(BaseModel):
             # Use DataTypeRegistry to get default value for type
             self._value = DataTypeRegistry.get_default_value(self.data_type)
 
-        self._value_changed = Signal()
-
     @property
     def value_changed(self) -> Signal:
         """Get value_changed signal."""
+        if self._value_changed is None:
+            self._value_changed = Signal()
         return self._value_changed
 
     def value(self) -> Any:
@@ -76,7 +76,7 @@ class ParameterModel(BaseModel):
         old_value = self._value
         self._value = value
 
-        if emit_signal and old_value != self._value:
+        if emit_signal and old_value != self._value and self._value_changed is not None:
             self._value_changed.emit(self._value)
 
     def reset_to_default(self) -> None:
@@ -104,8 +104,9 @@ class ParameterModel(BaseModel):
         Returns:
             ParameterModel instance
         """
-        # Extract value separately (not a model field)
-        value = data.pop("value", None)
+        # Extract value separately (not a model field, ignored by model_validate).
+        # The input dict is left untouched, it may be shared with the caller.
+        value = data.get("value")
 
         # Create parameter using Pydantic's model_validate
         param = cls.model_validate(data)
@@ -13,6 +13,9 @@ from weakref import WeakMethod, ref, ReferenceType
 class Signal:
     """Simple signal implementation that supports connect/disconnect/emit."""
 
+    # One signal exists per connector/parameter, so skip the per-instance __dict__
+    __slots__ = ("_slots",)
+
     def __init__(self):
         self._slots: List[Any] = []
 
@@ -20,6 +20,7 @@ from nodegraph.core.models import (
     ConnectorModel,
     ConnectorType,
     NodeModel,
+    NetworkModel,
 )
 
 
@@ -137,6 +138,11 @@ def test_connector_type_checking():
     success = any_out.connect_to(float_in2)
     assert success == True
 
+    # Types assigned later (not interned) still match by value
+    int_out.data_type = "".join(["flo", "at"])
+    success = int_out.connect_to(float_in2)
+    assert success == True
+
     print("✓ Connector type checking works (strict)")
 
 
@@ -242,6 +248,103 @@ def test_node_dirty_state():
     print("✓ Node dirty state management works (manual mark_dirty, with caching enabled)")
 
 
+def test_node_cook_memo():
+    """Test that cook results are reused when parameter values repeat."""
+    cook_calls = []
+
+    class DoubleNode(NodeModel):
+        def _cook_internal(self, inputs):
+            cook_calls.append(self.parameter("value").value())
+            return {"out": self.parameter("value").value() * 2}
+
+    node = DoubleNode(name="Double", enable_caching=True)
+    param = node.add_parameter("value", data_type="float", default_value=1.0)
+    node.add_output("out", data_type="float")
+
+    assert node.get_output_value("out") == 2.0
+
+    param.set_value(2.0)
+    assert node.get_output_value("out") == 4.0
+
+    # Toggling back to a previous value reuses the memoized result
+    param.set_value(1.0)
+    assert node.get_output_value("out") == 2.0
+    assert cook_calls == [1.0, 2.0]
+
+    # Unhashable values fall back to a normal cook
+    param.set_value([1.0])
+    assert node.get_output_value("out") == [1.0, 1.0]
+    param.set_value([2.0])
+    param.set_value([1.0])
+    assert node.get_output_value("out") == [1.0, 1.0]
+    assert cook_calls == [1.0, 2.0, [1.0], [1.0]]
+
+    print("✓ Node cook memoization works")
+
+
+def test_node_mark_dirty_forces_recook():
+    """Test that an explicit mark_dirty() bypasses the cook memo."""
+
+    # State outside inputs and parameters, invisible to the memo key
+    counter = [0]
+
+    class CounterNode(NodeModel):
+        def _cook_internal(self, inputs):
+            counter[0] += 1
+            return {"out": counter[0]}
+
+    network = NetworkModel()
+    node = CounterNode(name="Counter", enable_caching=True)
+    node.add_output("out", data_type="int")
+    network.add_node(node)
+
+    assert node.execute()
+    assert node.get_output_value("out") == 1
+
+    network.mark_all_dirty()
+    assert node.execute()
+    assert node.get_output_value("out") == 2
+
+    node.mark_dirty()
+    assert node.execute()
+    assert node.get_output_value("out") == 3
+
+    print("✓ Node mark_dirty forces a recook")
+
+
+def test_node_execute_caching_toggled_off():
+    """Test that a node whose caching was turned off after a cook is cooked again."""
+    cook_calls = []
+
+    class CountingNode(NodeModel):
+        def _cook_internal(self, inputs):
+            cook_calls.append(self.name)
+            return {"out": 1.0}
+
+    network = NetworkModel()
+    source = CountingNode(name="Source", enable_caching=True)
+    source.add_output("out", data_type="float")
+    sink = CountingNode(name="Sink", enable_caching=True)
+    sink.add_input("in", data_type="float")
+    network.add_node(source)
+    network.add_node(sink)
+    network.connect(source.id, "out", sink.id, "in")
+
+    assert sink.execute()
+    assert cook_calls == ["Source", "Sink"]
+
+    # Clean nodes are skipped while caching is on
+    assert sink.execute()
+    assert cook_calls == ["Source", "Sink"]
+
+    # Without caching the source must cook on every execute
+    source.enable_caching = False
+    assert sink.execute()
+    assert cook_calls == ["Source", "Sink", "Source"]
+
+    print("✓ Node execute with caching toggled off works")
+
+
 def run_all_tests():
     """Run all model tests."""
     print("=" * 60)
@@ -258,6 +361,9 @@ def run_all_tests():
     test_node_add_parameters()
     test_node_add_connectors()
     test_node_dirty_state()
+    test_node_cook_memo()
+    test_node_mark_dirty_forces_recook()
+    test_node_execute_caching_toggled_off()
 
     print("=" * 60)
     print("All model tests passed!")
@@ -7,6 +7,7 @@ Test the network management system including:
 
 import sys
 from pathlib import Path
+import time
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -24,6 +25,297 @@ def test_network_creation():
     print("✓ Network creation works")
 
 
+def test_network_unique_node_names():
+    """Test unique name allocation and lookup by name."""
+    network = NetworkModel()
+
+    node1 = NodeModel(name="Add")
+    node2 = NodeModel(name="Add")
+    node3 = NodeModel(name="Add_1")
+
+    network.add_node(node1)
+    network.add_node(node2)
+    network.add_node(node3)
+
+    assert node1.name == "Add"
+    assert node2.name == "Add_1"
+    assert node3.name == "Add_2"
+
+    assert network.get_node_by_name("Add_1") is node2
+    assert network.get_node_by_name("Missing") is None
+
+    network.remove_node(node2.id)
+    assert network.get_node_by_name("Add_1") is None
+
+    # Suffixes are not reused after removal
+    node4 = NodeModel(name="Add")
+    network.add_node(node4)
+    assert node4.name == "Add_3"
+
+    print("✓ Network unique node names work")
+
+
+def test_network_node_uuid_lookup():
+    """Test looking nodes up by their persistent UUID."""
+    network = NetworkModel()
+
+    node = NodeModel(name="A")
+    network.add_node(node)
+    assert network.get_node_by_uuid(node.uuid) is node
+
+    # A second node with the same persistent UUID is rejected
+    duplicate = NodeModel(name="B", uuid=node.uuid)
+    assert not network.add_node(duplicate)
+
+    network.remove_node(node.id)
+    assert network.get_node_by_uuid(node.uuid) is None
+    assert network.add_node(duplicate)
+
+    print("✓ Network node UUID lookup works")
+
+
+def test_network_rename_node():
+    """Test that renaming nodes keeps names unique and lookups working."""
+    network = NetworkModel()
+
+    node_a = NodeModel(name="A")
+    node_b = NodeModel(name="B")
+    network.add_node(node_a)
+    network.add_node(node_b)
+
+    node_a.name = "Renamed"
+    assert network.get_node_by_name("Renamed") is node_a
+    assert network.get_node_by_name("A") is None
+
+    # The old name is free again, the new one is taken
+    node_c = NodeModel(name="A")
+    network.add_node(node_c)
+    assert node_c.name == "A"
+    node_d = NodeModel(name="Renamed")
+    network.add_node(node_d)
+    assert node_d.name == "Renamed_1"
+
+    assert network.rename_node(node_b.id, "Renamed") == "Renamed_2"
+    assert network.get_node_by_name("Renamed_2") is node_b
+    assert network.get_node_by_name("B") is None
+
+    print("✓ Network node renaming works")
+
+
+def test_network_topological_order():
+    """Test topological ordering and its cache invalidation."""
+    network = NetworkModel()
+
+    node_a = NodeModel(name="A")
+    node_a.add_output("out", data_type="float")
+    node_b = NodeModel(name="B")
+    node_b.add_input("in", data_type="float")
+    node_b.add_output("out", data_type="float")
+    node_c = NodeModel(name="C")
+    node_c.add_input("in", data_type="float")
+
+    # Add in reverse order so insertion order is not a valid topological order
+    network.add_node(node_c)
+    network.add_node(node_b)
+    network.add_node(node_a)
+
+    network.connect(node_a.id, "out", node_b.id, "in")
+    network.connect(node_b.id, "out", node_c.id, "in")
+
+    order = network.topological_order()
+    assert [node.name for node in order] == ["A", "B", "C"]
+    assert list(node_c.iter_parent_nodes()) == [node_b]
+    assert list(node_a.iter_parent_nodes()) == []
+
+    # Parent/child lists are cached per topology version
+    parents = node_c.get_parent_nodes()
+    assert parents == [node_b]
+    assert node_c.get_parent_nodes() is parents
+    assert node_a.get_child_nodes() == [node_b]
+
+    # Cached until the topology changes
+    assert network.topological_order() is order
+
+    network.disconnect(node_b.id, "out", node_c.id, "in")
+    assert network.topological_order() is not order
+    assert node_c.get_parent_nodes() == []
+    assert len(network.topological_order()) == 3
+
+    print("✓ Network topological order works")
+
+
+def test_network_cycle_rejection():
+    """Test that connections creating a cycle are rejected."""
+    network = NetworkModel()
+
+    nodes = []
+    for name in ("A", "B", "C"):
+        node = NodeModel(name=name)
+        node.add_input("in", data_type="float")
+        node.add_output("out", data_type="float")
+        network.add_node(node)
+        nodes.append(node)
+    node_a, node_b, node_c = nodes
+
+    # C -> A goes against insertion order, so the index has to be reordered
+    assert network.connect(node_c.id, "out", node_a.id, "in")
+    assert network.connect(node_b.id, "out", node_c.id, "in")
+
+    # A -> B would close the loop B -> C -> A -> B
+    assert not network.connect(node_a.id, "out", node_b.id, "in")
+    assert not node_b.input("in").is_connected()
+    assert not network.has_cycle()
+
+    order = [node.name for node in network.topological_order()]
+    assert order == ["B", "C", "A"]
+
+    print("✓ Network cycle rejection works")
+
+
+def test_network_batch():
+    """Test that batch() collapses change notifications."""
+    network = NetworkModel()
+
+    added = []
+    changes = []
+
+    def on_node_added(node):
+        added.append(node)
+
+    def on_network_changed():
+        changes.append(True)
+
+    network.node_added.connect(on_node_added)
+    network.network_changed.connect(on_network_changed)
+
+    with network.batch():
+        node1 = NodeModel(name="A")
+        node1.add_output("out", data_type="float")
+        node2 = NodeModel(name="B")
+        node2.add_input("in", data_type="float")
+        network.add_node(node1)
+        network.add_node(node2)
+        network.connect(node1.id, "out", node2.id, "in")
+
+        # Nested batches only notify once, at the outermost exit
+        with network.batch():
+            network.disconnect(node1.id, "out", node2.id, "in")
+
+        assert len(changes) == 0
+
+    assert len(added) == 0
+    assert len(changes) == 1
+
+    # Signals are emitted per change again after the batch
+    network.connect(node1.id, "out", node2.id, "in")
+    assert len(changes) == 2
+
+    print("✓ Network batch works")
+
+
+def test_network_execution_levels():
+    """Test grouping nodes into independent execution levels and executing them."""
+    network = NetworkModel()
+
+    nodes = {}
+    for name in ("A", "B", "C", "D"):
+        node = NodeModel(name=name, enable_caching=True)
+        node.add_input("in1", data_type="float")
+        node.add_input("in2", data_type="float")
+        node.add_output("out", data_type="float")
+        network.add_node(node)
+        nodes[name] = node
+
+    # Diamond: A -> B, A -> C, B -> D, C -> D
+    network.connect(nodes["A"].id, "out", nodes["B"].id, "in1")
+    network.connect(nodes["A"].id, "out", nodes["C"].id, "in1")
+    network.connect(nodes["B"].id, "out", nodes["D"].id, "in1")
+    network.connect(nodes["C"].id, "out", nodes["D"].id, "in2")
+
+    levels = [sorted(node.name for node in level) for level in network.execution_levels()]
+    assert levels == [["A"], ["B", "C"], ["D"]]
+
+    assert network.execute(max_workers=2)
+    assert not any(node.is_dirty() for node in nodes.values())
+
+    print("✓ Network execution levels work")
+
+
+def test_network_connector_level_connections():
+    """Test that connections made directly on connectors update the network."""
+    network = NetworkModel()
+
+    node_p = NodeModel(name="P")
+    node_p.add_input("in", data_type="float")
+    node_p.add_output("out", data_type="float")
+    node_q = NodeModel(name="Q")
+    node_q.add_input("in", data_type="float")
+    node_q.add_output("out", data_type="float")
+    network.add_node(node_p)
+    network.add_node(node_q)
+
+    assert node_p.output("out").connect_to(node_q.input("in"))
+
+    assert [node.name for node in node_q._get_local_execution_order()] == ["P", "Q"]
+    assert [node.name for node in network.get_execution_order()] == ["P", "Q"]
+    assert node_q.get_parent_nodes() == [node_p]
+    assert len(network.connector_pairs()) == 1
+
+    # A cycle made on the connectors is reported, and connect() keeps
+    # rejecting cycles after it is removed again
+    assert node_q.output("out").connect_to(node_p.input("in"))
+    assert network.has_cycle()
+    assert node_q.output("out").disconnect_from(node_p.input("in"))
+    assert not network.has_cycle()
+    assert not network.connect(node_q.id, "out", node_p.id, "in")
+
+    node_p.output("out").disconnect_from(node_q.input("in"))
+    assert node_q.get_parent_nodes() == []
+    assert len(network.connector_pairs()) == 0
+
+    # Connections made before the node joined the network are picked up
+    node_r = NodeModel(name="R")
+    node_r.add_input("in", data_type="float")
+    node_q.output("out").connect_to(node_r.input("in"))
+    network.add_node(node_r)
+    assert node_r.get_parent_nodes() == [node_q]
+
+    print("✓ Network tracks connector-level connections")
+
+
+def test_network_execute_threads_without_caching():
+    """Test parallel execution when nodes recook their parents (caching off)."""
+    cook_calls = []
+
+    class SlowNode(NodeModel):
+        def _cook_internal(self, inputs):
+            cook_calls.append(self.name)
+            time.sleep(0.01)  # Widen the window for overlapping cooks
+            return {"out": 1.0 + sum(value or 0.0 for value in inputs.values())}
+
+    network = NetworkModel()
+    source = SlowNode(name="A")
+    source.add_output("out", data_type="float")
+    network.add_node(source)
+
+    children = []
+    for index in range(4):
+        child = SlowNode(name=f"C{index}")
+        child.add_input("in", data_type="float")
+        child.add_output("out", data_type="float")
+        network.add_node(child)
+        network.connect(source.id, "out", child.id, "in")
+        children.append(child)
+
+    assert network.execute(max_workers=4)
+
+    # Once for its level, then once more for every child pulling its value
+    assert cook_calls.count("A") == 5
+    assert all(child.get_output_value("out") == 2.0 for child in children)
+
+    print("✓ Network threaded execution without caching works")
+
+
 def run_all_tests():
     """Run all network tests."""
     print("=" * 60)
@@ -31,6 +323,15 @@ def run_all_tests():
     print("=" * 60)
 
     test_network_creation()
+    test_network_unique_node_names()
+    test_network_node_uuid_lookup()
+    test_network_rename_node()
+    test_network_topological_order()
+    test_network_cycle_rejection()
+    test_network_batch()
+    test_network_execution_levels()
+    test_network_connector_level_connections()
+    test_network_execute_threads_without_caching()
 
     print("=" * 60)
     print("All NetworkModel tests passed!")
@@ -20,6 +20,7 @@ from nodegraph.core.models import (
     ConnectorModel,
     ConnectorType,
     NodeModel,
+    NetworkModel,
 )
 
 
@@ -55,6 +56,9 @@ def test_parameter_serialization():
     assert param2.value() == param.value()
     assert param2.default_value == param.default_value
 
+    # The input data is left untouched
+    assert data["value"] == 3.7
+
     print("✓ Parameter serialization works")
 
 
@@ -87,6 +91,9 @@ def test_connector_serialization():
     assert conn2.connector_type == conn.connector_type
     assert conn2.data_type == conn.data_type
 
+    # The input data is left untouched
+    assert data["connector_type"] == "input"
+
     print("✓ Connector serialization works")
 
 
@@ -120,6 +127,27 @@ def test_node_serialization():
     print("✓ Node serialization works")
 
 
+def test_node_subclass_serialization():
+    """Test that fields declared by NodeModel subclasses survive a roundtrip."""
+
+    class ScaleNode(NodeModel):
+        factor: float = 1.0
+        mode: str = "linear"
+
+    node = ScaleNode(name="Scale", node_type="ScaleNode", factor=2.5, mode="log")
+
+    data = json.loads(json.dumps(node.serialize()))
+    assert data["factor"] == 2.5
+    assert data["mode"] == "log"
+    assert "network" not in data
+
+    restored = ScaleNode.deserialize(data)
+    assert restored.factor == 2.5
+    assert restored.mode == "log"
+
+    print("✓ Node subclass serialization works")
+
+
 def test_roundtrip_serialization():
     """Test complete roundtrip: serialize and deserialize."""
     # Create parameter
@@ -145,6 +173,84 @@ def test_roundtrip_serialization():
     print("✓ Roundtrip serialization works")
 
 
+def test_network_serialization():
+    """Test network roundtrip including connections."""
+    network = NetworkModel(name="TestNetwork")
+
+    nodes = []
+    for name in ("A", "B", "C"):
+        node = NodeModel(name=name)
+        node.add_input("in", data_type="float")
+        node.add_output("out", data_type="float")
+        network.add_node(node)
+        nodes.append(node)
+    node_a, node_b, node_c = nodes
+
+    network.connect(node_c.id, "out", node_b.id, "in")
+    network.connect(node_b.id, "out", node_a.id, "in")
+
+    data = network.serialize()
+    assert len(data["connections"]) == 2
+
+    restored = NetworkModel.deserialize(json.loads(json.dumps(data, default=str)))
+
+    assert restored.node_count() == 3
+    assert len(restored.connector_pairs()) == 2
+    assert [node.name for node in restored.topological_order()] == ["C", "B", "A"]
+
+    # Incremental cycle detection keeps working on the restored network
+    restored_a = restored.get_node_by_name("A")
+    restored_c = restored.get_node_by_name("C")
+    assert not restored.connect(restored_a.id, "out", restored_c.id, "in")
+
+    # Cyclic input data is rejected
+    cyclic_data = dict(data, connections=data["connections"] + [{
+        "source_node": str(node_a.uuid),
+        "source_output": "out",
+        "target_node": str(node_c.uuid),
+        "target_input": "in",
+    }])
+    try:
+        NetworkModel.deserialize(cyclic_data)
+        assert False, "Cyclic network should not deserialize"
+    except ValueError:
+        pass
+
+    print("✓ Network serialization works")
+
+
+def test_network_serialization_fresh():
+    """Test that serialize() returns fresh data reflecting every change."""
+    network = NetworkModel(name="TestNetwork")
+
+    node1 = NodeModel(name="A")
+    node1.add_parameter("value", data_type="float", default_value=1.0)
+    node1.add_output("out", data_type="float")
+    node2 = NodeModel(name="B")
+    node2.add_input("in", data_type="float")
+    network.add_node(node1)
+    network.add_node(node2)
+    network.connect(node1.id, "out", node2.id, "in")
+
+    # A roundtrip must not alter later results
+    data = network.serialize()
+    NetworkModel.deserialize(data)
+    data = network.serialize()
+    assert data["nodes"][0]["parameters"]["value"]["value"] == 1.0
+    json.dumps(data)
+
+    # Changes that emit no signal are still picked up
+    node1.color = "#ff0000"
+    node1.set_position(10.0, 20.0, emit_signal=False)
+    node2.add_input("extra", data_type="float")
+    data = network.serialize()
+    assert data["nodes"][0]["color"] == "#ff0000"
+    assert data["nodes"][0]["position"] == (10.0, 20.0)
+    assert "extra" in data["nodes"][1]["inputs"]
+
+    print("✓ Network serialization returns fresh data")
+
+
 def run_all_tests():
     """Run all serialization tests."""
     print("=" * 60)
@@ -154,7 +260,10 @@ def run_all_tests():
     test_parameter_serialization()
     test_connector_serialization()
     test_node_serialization()
+    test_node_subclass_serialization()
     test_roundtrip_serialization()
+    test_network_serialization()
+    test_network_serialization_fresh()
 
     print("=" * 60)
     print("All serialization tests passed!")